@@ -87,7 +87,7 @@ class GameInput:
         Args:
             action: The pressed action.
         """
-        assert action in self.state.keys()
+        assert action in self.state
         self.queued_actions.append(action)
 
     def add_actions(self, actions: list[str]):
@@ -99,7 +99,7 @@ class GameInput:
             actions: A list of pressed actions.
         """
         for action in actions:
-            assert action in self.state.keys()
+            assert action in self.state
         self.queued_actions.extend(actions)
 
     def update_input(self):
@@ -24,6 +24,7 @@ have taken effect in the game when you write to these memory locations.
 
 from __future__ import annotations
 
+import ctypes
 import platform
 from typing import NotRequired, TypedDict
 
@@ -74,7 +75,7 @@ class MemoryManipulator(metaclass=Singleton):
             # Create Pymem object once, this has a relative long initialziation
             self.pymem = Pymem()
             self.pymem.open_process_from_id(self.pid)
-            self.address_cache: dict[str, int] = {}
+            self.address_cache: dict[tuple, int] = {}
             # Find the base addresses. Use static addresses where nothing else available. Else use
             # pymems AOB scan functions
             self.process_module = pym.process.module_from_name(
@@ -98,9 +99,10 @@ class MemoryManipulator(metaclass=Singleton):
         Returns:
             The resolved address.
         """
-        unique_address_id = str((record["offsets"], record["base"]))
-        if unique_address_id in self.address_cache:  # Look up the cache first
-            return self.address_cache[unique_address_id]
+        unique_address_id = (record["base"], *record["offsets"])
+        # Look up the cache first
+        if (address := self.address_cache.get(unique_address_id)) is not None:
+            return address
         # When no cache hit: resolve by following the pointer chain until its last link
         address = self.pymem.read_longlong(self.bases[record["base"]])
         for offset in record["offsets"][:-1]:
@@ -177,6 +179,9 @@ class MemoryManipulator(metaclass=Singleton):
     def read_int(self, address: int) -> int:
         """Read an integer from memory.
 
+        The integer is read into a ``ctypes`` buffer to skip the intermediate ``bytes`` object and
+        the unpacking of ``pymem``.
+
         Args:
             address: The read address.
 
@@ -186,11 +191,15 @@ class MemoryManipulator(metaclass=Singleton):
         Raises:
             pym.exception.MemoryReadError: An error with the memory read occured.
         """
-        return self.pymem.read_long(address)
+        buffer = ctypes.c_int32()
+        self.read_into(address, buffer)
+        return buffer.value
 
     def read_float(self, address: int) -> float:
         """Read a float from memory.
 
+        The float is read into a ``ctypes`` buffer, see :meth:`.MemoryManipulator.read_int`.
+
         Args:
             address: The read address.
 
@@ -200,7 +209,9 @@ class MemoryManipulator(metaclass=Singleton):
         Raises:
             pym.exception.MemoryReadError: An error with the memory read occured.
         """
-        return self.pymem.read_float(address)
+        buffer = ctypes.c_float()
+        self.read_into(address, buffer)
+        return buffer.value
 
     def read_string(
         self, address: int, length: int, null_term: bool = True, codec: str = "utf-16"
@@ -220,21 +231,38 @@ class MemoryManipulator(metaclass=Singleton):
             pym.exception.MemoryReadError: An error with the memory read occured.
             UnicodeDecodeError: An error with the decoding of the read bytes occured.
         """
-        s = self.pymem.read_bytes(address, length)
+        return self.decode_string(self.read_bytes(address, length), null_term, codec)
+
+    @staticmethod
+    def decode_string(s: bytes, null_term: bool = True, codec: str = "utf-16") -> str:
+        """Decode a string from raw memory bytes.
+
+        Args:
+            s: The raw bytes as read by :meth:`.MemoryManipulator.read_bytes`.
+            null_term: String should be cut after double 0x00.
+            codec: The codec used to decode the bytes.
+
+        Returns:
+            The string.
+
+        Raises:
+            UnicodeDecodeError: An error with the decoding of the bytes occured.
+        """
         if null_term:
-            pos = 0
-            for i in range(1, length, 2):
-                if s[i - 1] == 0x00 and s[i] == 0x00:
-                    pos = i
-                    break
-            s = s[: pos - 1]
-            if not pos:
-                s = s + bytes(1)  # Add null termination for strings which exceed 20 chars.
+            # Search the first double 0x00 that is aligned with the 2 byte characters
+            pos = s.find(b"\x00\x00")
+            while pos > 0 and pos % 2:
+                pos = s.find(b"\x00\x00", pos + 1)
+            # Add null termination for strings which exceed 20 chars.
+            s = s[:pos] if pos >= 0 else s[:-1] + bytes(1)
         return s.decode(codec)
 
     def read_bytes(self, address: int, length: int) -> bytes:
         """Read raw bytes from memory.
 
+        Reads directly with ``ReadProcessMemory`` like :meth:`.MemoryManipulator.read_into` to skip
+        the call overhead of ``pymem``.
+
         Args:
             address: The read address.
             length: The bytes length.
@@ -245,11 +273,75 @@ class MemoryManipulator(metaclass=Singleton):
         Raises:
             pym.exception.MemoryReadError: An error with the memory read occured.
         """
-        return self.pymem.read_bytes(address, length)
+        buffer = ctypes.create_string_buffer(length)
+        self.read_into(address, buffer)
+        return buffer.raw
+
+    def read_into(self, address: int, buffer: ctypes.Array | ctypes.Structure):
+        """Read raw bytes from memory into a preallocated ``ctypes`` buffer.
+
+        Reusing the same buffer for recurring reads avoids allocating a new ``bytes`` object on each
+        read. The number of bytes read is determined by the buffer size. Buffers can also be
+        ``ctypes.Structure`` instances to read C structures of the game in a single call.
+
+        Warning:
+            The caller owns the buffer. ``ReadProcessMemory`` releases the GIL, so a buffer must not
+            be shared between threads that read concurrently.
+
+        Args:
+            address: The read address.
+            buffer: The target buffer, e.g. ``(ctypes.c_char * 24)()`` or a structure instance.
+
+        Raises:
+            pym.exception.MemoryReadError: An error with the memory read occured.
+        """
+        length = ctypes.sizeof(buffer)
+        handle = self.pymem.process_handle
+        if not pym.ressources.kernel32.ReadProcessMemory(
+            handle, address, ctypes.byref(buffer), length, None
+        ):
+            error_code = ctypes.windll.kernel32.GetLastError()
+            raise pym.exception.MemoryReadError(address, length, error_code)
+
+    def read_u8(self, address: int) -> int:
+        """Read a single unsigned byte from memory.
+
+        The byte is read into a ``ctypes`` buffer and returned as integer to avoid creating a
+        ``bytes`` object for single byte flags.
+
+        Args:
+            address: The read address.
+
+        Returns:
+            The byte value.
+
+        Raises:
+            pym.exception.MemoryReadError: An error with the memory read occured.
+        """
+        buffer = ctypes.c_ubyte()
+        self.read_into(address, buffer)
+        return buffer.value
+
+    def read_bit(self, address: int, index: int) -> bool:
+        """Read a single bit.
+
+        Args:
+            address: The read address.
+            index: The index of the bit (0 ... 7).
+
+        Returns:
+            True if the bit is set, else False.
+
+        Raises:
+            pym.exception.MemoryReadError: An error with the memory read occured.
+        """
+        return bool(self.read_u8(address) & (1 << index))
 
     def write_bit(self, address: int, index: int, value: int):
         """Write a single bit.
 
+        The byte is only written if the bit does not already have the desired value.
+
         Args:
             address: The write address.
             index: The index of the bit (0 ... 7).
@@ -258,12 +350,11 @@ class MemoryManipulator(metaclass=Singleton):
         Raises:
             pym.exception.MemoryWriteError: An error with the memory write occured.
         """
-        byte = self.read_bytes(address, 1)
-        mask = (1 << index).to_bytes(1, "little")
-        byte = (byte[0] & ~mask[0]).to_bytes(1, "little")
-        if value:
-            byte = (byte[0] | mask[0]).to_bytes(1, "little")
-        self.write_bytes(address, byte)
+        byte = self.read_u8(address)
+        mask = 1 << index
+        new_byte = byte | mask if value else byte & ~mask
+        if new_byte != byte:
+            self.write_bytes(address, bytes((new_byte,)))
 
     def write_int(self, address: int, value: int):
         """Write an integer to memory.
@@ -289,16 +380,18 @@ class MemoryManipulator(metaclass=Singleton):
         """
         pym.memory.write_float(self.pymem.process_handle, address, value)
 
-    def write_bytes(self, address: int, buffer: bytes):
+    def write_bytes(self, address: int, buffer: bytes | bytearray):
         """Write a series of bytes to memory.
 
         Args:
             address: The write address for the first byte.
-            buffer: The bytes.
+            buffer: The bytes. Mutable buffers are written without copying them.
 
         Raises:
             pym.exception.MemoryWriteError: An error with the memory write occured.
         """
+        if isinstance(buffer, bytearray):  # ctypes can't pass bytearrays, share their memory
+            buffer = (ctypes.c_char * len(buffer)).from_buffer(buffer)
         pym.memory.write_bytes(self.pymem.process_handle, address, buffer, len(buffer))
 
     def _load_bases(self, process_name: str) -> dict:
@@ -185,8 +185,7 @@ class IudexEnv(SoulsEnv):
         game_state.player_animation = self.game.player_animation
         game_state.player_pose = self.game.player_pose
         game_state.camera_pose = self.game.camera_pose
-        game_state.player_hp = self.game.player_hp
-        game_state.player_sp = self.game.player_sp
+        game_state.player_hp, game_state.player_sp = self.game.player_hp_sp
         return game_state.copy()
 
     @max_retries(retries=3)
@@ -208,18 +207,14 @@ class IudexEnv(SoulsEnv):
             self._arena_setup()
         if self._phase_setup_required():
             self._phase_setup()
-        self.game.allow_attacks = False
-        self.game.allow_hits = False
-        self.game.allow_moves = False
+        self.game.set_dbg_flags(attacks=False, hits=False, moves=False)
         self.game.time = 0  # Reset the total play time to avoid stuck timer on 999.99h
         self.game.game_speed = 3  # Increase game speed to speed up recovery
         self._entity_reset()
         self._camera_reset()
         self.game.pause()
         self.terminated = False
-        self.game.allow_attacks = True
-        self.game.allow_hits = True
-        self.game.allow_moves = True
+        self.game.set_dbg_flags(attacks=True, hits=True, moves=True)
         self._game_state = self.game_state()
         return self.obs, self.info
 
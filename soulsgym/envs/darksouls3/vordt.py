@@ -157,8 +157,7 @@ class VordtEnv(SoulsEnv):
         game_state.player_animation = self.game.player_animation
         game_state.player_pose = self.game.player_pose
         game_state.camera_pose = self.game.camera_pose
-        game_state.player_hp = self.game.player_hp
-        game_state.player_sp = self.game.player_sp
+        game_state.player_hp, game_state.player_sp = self.game.player_hp_sp
         return game_state.copy()
 
     def reset(self, seed: int | None = None, options: Any | None = None) -> tuple[dict, dict]:
@@ -261,8 +260,7 @@ class VordtEnv(SoulsEnv):
 
     def _entity_reset(self):
         """Reset the player and boss entities."""
-        self.game.allow_attacks = False
-        self.game.allow_moves = False
+        self.game.set_dbg_flags(attacks=False, moves=False)
         self.game.game_speed = 3  # Faster reset
         self.game.player_frost_resistance = 1.0
         # self.game.player_frost_effect = 0.  TODO: Can't be set to 0, maybe change address?
@@ -271,8 +269,7 @@ class VordtEnv(SoulsEnv):
             self.game.vordt_pose = self.game.data.coordinates[self.ENV_ID]["boss_init_pose"]
             self.game.sleep(0.01)
         self.game.pause()
-        self.game.allow_attacks = True
-        self.game.allow_moves = True
+        self.game.set_dbg_flags(attacks=True, moves=True)
 
     def _entity_reset_complete(self) -> bool:
         """Check if the player and boss have been successfully reset.
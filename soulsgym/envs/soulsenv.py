@@ -11,6 +11,7 @@ agent's abilities in a setting that is as close to the real game as possible.
 from __future__ import annotations
 
 import logging
+import math
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, ClassVar
 
@@ -291,7 +292,8 @@ class SoulsEnv(gymnasium.Env, ABC):
         self._apply_action(action)
         # Offset of 0.01s to account for processing time of the loop
         t_loop = self.game.time
-        while self.game.timed(self.game.time, t_start) < (max(self.step_size - 0.01, 1e-4)):
+        timed, t_step = self.game.timed, max(self.step_size - 0.01, 1e-4)
+        while timed(self.game.time, t_start) < t_step:
             boss_animation = getattr(self.game, self.ENV_ID + "_animation")
             if boss_animation != previous_boss_animation:
                 boss_animation_start = self.game.time
@@ -465,8 +467,8 @@ class SoulsEnv(gymnasium.Env, ABC):
                     return
                 self._lock_on_timer -= 1
                 dz = cpose[5] - normal[2]  # Camera pose is [x, y, z, nx, ny, nz], we need nz
-                normal_angle = np.arctan2(*normal[:2])
-                d_angle = wrap_to_pi(np.arctan2(cpose[3], cpose[4]) - normal_angle)
+                normal_angle = math.atan2(normal[0], normal[1])  # Scalar math is faster than numpy
+                d_angle = wrap_to_pi(math.atan2(cpose[3], cpose[4]) - normal_angle)
                 if abs(dz) > 0.3:
                     self._game_input.add_action("cameradown" if dz > 0 else "cameraup")
                 if abs(d_angle) > 0.3:
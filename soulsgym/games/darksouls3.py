@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import ctypes
 import logging
+import math
 import struct
 import time
 from typing import Any
@@ -15,12 +17,42 @@ from soulsgym.games import Game
 
 logger = logging.getLogger(__name__)
 
+# Pose memory layout of game entities as floats: Angle, 2 floats padding, x, z, y. The index
+# gathers the pose in [x, y, z, a] order
+_POSE_INDEX = np.array([3, 5, 4, 0])
+# Coordinates are stored in x, z, y order
+_XZY_PACK_INTO = struct.Struct("fff").pack_into
+# Debug flag bytes indexed by the flag value. A set byte disables the feature
+_FLAG_BYTES = (b"\x01", b"\x00")
+# Null-terminated animation names as stored in memory. The terminator avoids prefix matches
+_ANIM_IDLE = "Idle".encode("utf-16-le") + b"\x00\x00"
+_ANIM_EVENT63000 = "Event63000".encode("utf-16-le") + b"\x00\x00"
+# Player stats memory layout: Vigor, Attunement, Endurance, Strength, Dexterity, Intelligence, Faith,
+# Luck, 8 bytes padding, Vitality, Soul Level
+_STATS_STRUCT = struct.Struct("8i8x2i")
+_STATS_HEAD_PACK, _STATS_TAIL_PACK = struct.Struct("8i").pack, struct.Struct("2i").pack
+# Player resource memory layout: HP, 20 bytes (maximum HP and others), SP
+_HP_SP_STRUCT = struct.Struct("i20xi")
+# Window resolution memory layout: Width, height
+_RESOLUTION_STRUCT = struct.Struct("ii")
+# Camera memory layout: Normal nx, nz, ny, 4 bytes padding, x, z, y
+_CAM_STRUCT = struct.Struct("fff4xfff")
+_CAM_UNPACK = _CAM_STRUCT.unpack_from
+_MS_TO_S = 1 / 1000  # Conversion factor from the game time in milliseconds to seconds
+
 
 class DarkSoulsIII(Game):
     """Dark Souls III game interface."""
 
     game_id = "DarkSoulsIII"
     process_name = "DarkSoulsIII.exe"
+    # The global debug flags are stored as single bytes in a contiguous memory region starting at
+    # the WorldChrManDbg_Flags base. We cover all flags from player death (0x0) to weapon durability
+    # damage (0xE) to batch reads and writes. The region also contains other WorldChrManDbg flags
+    # (0x1 - 0x7, 0x9, 0xD) which are written back unchanged with the region
+    _DBG_FLAGS_SIZE = 0xF
+    # Offsets of player death, deaths, hits, attacks, moves and weapon durability damage flags
+    _DBG_FLAG_OFFSETS = (0x0, 0x8, 0xA, 0xB, 0xC, 0xE)
 
     def __init__(self):
         """Initialize the :class:`.MemoryManipulator` and the :class:`.GameInput`.
@@ -31,7 +63,12 @@ class DarkSoulsIII(Game):
         """
         super().__init__()  # Initialize helpers for game access and manipulation
         # Helper attributes
-        self._game_flags = {}  # Cache game flags to restore them after a game reload
+        self._game_flags = None  # Cache game flags to restore them after a game reload
+        self._animation_cache: dict[str, tuple[bytes, str]] = {}  # Last raw and decoded animation
+        self._pose_raw = (ctypes.c_char * 24)()  # Reused buffer for player and boss pose reads
+        self._pose_view = np.frombuffer(self._pose_raw, dtype=np.float32)  # Float view on buffer
+        self._xzy_raw = bytearray(12)  # Reused buffer for player and boss coordinate writes
+        self._cam_raw = (ctypes.c_char * _CAM_STRUCT.size)()  # Reused buffer for camera pose reads
         self._game_speed = 1.0
         self.game_speed = 1.0
 
@@ -82,14 +119,14 @@ class DarkSoulsIII(Game):
         Returns:
             The game window resolution.
         """
-        width = self.mem.read_record(self.data.addresses["WindowScreenWidth"])
-        height = self.mem.read_record(self.data.addresses["WindowScreenHeight"])
-        return (width, height)
+        # The height is stored directly after the width, so we read both in one call
+        address = self.mem.resolve_record(self.data.addresses["WindowScreenWidth"])
+        return _RESOLUTION_STRUCT.unpack(self.mem.read_bytes(address, _RESOLUTION_STRUCT.size))
 
     @window_resolution.setter
     def window_resolution(self, resolution: tuple[int, int]):
-        self.mem.write_record(self.data.addresses["WindowScreenWidth"], resolution[0])
-        self.mem.write_record(self.data.addresses["WindowScreenHeight"], resolution[1])
+        address = self.mem.resolve_record(self.data.addresses["WindowScreenWidth"])
+        self.mem.write_bytes(address, _RESOLUTION_STRUCT.pack(resolution[0], resolution[1]))
 
     @property
     def screen_mode(self) -> str:
@@ -114,7 +151,7 @@ class DarkSoulsIII(Game):
         Returns:
             The player's current hit points.
         """
-        return self.mem.read_record(self.data.addresses["PlayerHP"])
+        return self.mem.read_int(self._resolve("PlayerHP"))
 
     @player_hp.setter
     def player_hp(self, hp: int):
@@ -127,12 +164,30 @@ class DarkSoulsIII(Game):
         Returns:
             The player's current stamina points.
         """
-        return self.mem.read_record(self.data.addresses["PlayerSP"])
+        return self.mem.read_int(self._resolve("PlayerSP"))
 
     @player_sp.setter
     def player_sp(self, sp: int):
         self.mem.write_record(self.data.addresses["PlayerSP"], sp)
 
+    @property
+    def player_hp_sp(self) -> tuple[int, int]:
+        """The player's current hit points and stamina points.
+
+        Both values are stored in the same block and read with a single memory access. Use this
+        property instead of :attr:`.DarkSoulsIII.player_hp` and :attr:`.DarkSoulsIII.player_sp` if
+        both values are required.
+
+        Returns:
+            The player's current hit points and stamina points.
+        """
+        address = self._resolve("PlayerHP")
+        return _HP_SP_STRUCT.unpack(self.mem.read_bytes(address, _HP_SP_STRUCT.size))
+
+    @player_hp_sp.setter
+    def player_hp_sp(self, _: tuple[int, int]):
+        raise NotImplementedError("Use player_hp and player_sp to set the values")
+
     @property
     def player_max_hp(self) -> int:
         """The player's maximum hit points.
@@ -140,7 +195,7 @@ class DarkSoulsIII(Game):
         Returns:
             The player's maximum hit points.
         """
-        return self.mem.read_record(self.data.addresses["PlayerMaxHP"])
+        return self.mem.read_int(self._resolve("PlayerMaxHP"))
 
     @player_max_hp.setter
     def player_max_hp(self, _: int):
@@ -153,7 +208,7 @@ class DarkSoulsIII(Game):
         Returns:
             The player's maximum stamina points.
         """
-        return self.mem.read_record(self.data.addresses["PlayerMaxSP"])
+        return self.mem.read_int(self._resolve("PlayerMaxSP"))
 
     @player_max_sp.setter
     def player_max_sp(self, _: int):
@@ -185,10 +240,8 @@ class DarkSoulsIII(Game):
         Returns:
             The current player pose as [x, y, z, a].
         """
-        address = self.mem.resolve_record(self.data.addresses["PlayerA"])
-        buff = self.mem.read_bytes(address, length=24)
-        a, x, z, y = struct.unpack("f" + 8 * "x" + "fff", buff)  # Order as in the memory structure.
-        return np.array([x, y, z, a])
+        self.mem.read_into(self._resolve("PlayerA"), self._pose_raw)
+        return self._pose_view[_POSE_INDEX].astype(np.float64)  # Reorder from the memory layout
 
     @player_pose.setter
     def player_pose(self, coordinates: tuple[float]):
@@ -197,13 +250,14 @@ class DarkSoulsIII(Game):
         # between coordinates, we pack xzy into a byte package and write it in one call. We can't
         # include `a` because of the memory layout, but this is less important as the orientation
         # can still be updated after a tick delay.
+        # Resolve all addresses before the teleport to keep the time without gravity short
+        x_address, a_address = self._resolve("PlayerX"), self._resolve("PlayerA")
         buff_death = self.allow_player_death
         self.allow_player_death = False
         self.gravity = False
-        x_address = self.mem.resolve_record(self.data.addresses["PlayerX"])
-        a_address = self.mem.resolve_record(self.data.addresses["PlayerA"])
-        xzy = struct.pack("fff", coordinates[0], coordinates[2], coordinates[1])  # Swap y z order
-        self.mem.write_bytes(x_address, xzy)
+        # Swap y z order
+        _XZY_PACK_INTO(self._xzy_raw, 0, coordinates[0], coordinates[2], coordinates[1])
+        self.mem.write_bytes(x_address, self._xzy_raw)
         self.mem.write_float(a_address, coordinates[3])
         self.gravity = True
         self.allow_player_death = buff_death
@@ -219,7 +273,7 @@ class DarkSoulsIII(Game):
         Returns:
             The player's current animation name.
         """
-        return self.mem.read_record(self.data.addresses["PlayerAnimation"])
+        return self._read_animation("PlayerAnimation")
 
     @player_animation.setter
     def player_animation(self, _: str):
@@ -235,7 +289,7 @@ class DarkSoulsIII(Game):
         Returns:
             The player's current animation time.
         """
-        return self.mem.read_record(self.data.addresses["PlayerAnimationTime"])
+        return self.mem.read_float(self._resolve("PlayerAnimationTime"))
 
     @player_animation_time.setter
     def player_animation_time(self, _: float):
@@ -251,7 +305,7 @@ class DarkSoulsIII(Game):
         Returns:
             The player's current animation maximum duration.
         """
-        return self.mem.read_record(self.data.addresses["PlayerAnimationMaxTime"])
+        return self.mem.read_float(self._resolve("PlayerAnimationMaxTime"))
 
     @player_animation_max_time.setter
     def player_animation_max_time(self, _: float):
@@ -260,11 +314,11 @@ class DarkSoulsIII(Game):
     @property
     def allow_player_death(self) -> bool:
         """Disable/enable player deaths ingame."""
-        return self.mem.read_bytes(self.mem.bases["WorldChrManDbg_Flags"], 1) == b"\x00"
+        return self._read_dbg_flag(0x0)
 
     @allow_player_death.setter
     def allow_player_death(self, flag: bool):
-        self.mem.write_bytes(self.mem.bases["WorldChrManDbg_Flags"], struct.pack("B", not flag))
+        self._write_dbg_flag(0x0, flag)
 
     @property
     def player_stats(self) -> tuple[int]:
@@ -277,19 +331,22 @@ class DarkSoulsIII(Game):
         Returns:
             A tuple with all player attributes in the same order as in the game.
         """
-        stats_address = self.mem.resolve_record(self.data.addresses["PlayerStats"])
-        # Offsets are relative to the stats address. The memory layout does not match the order of
-        # the stats in the game
-        offsets = (0x2C, 0x00, 0x04, 0x08, 0x28, 0x0C, 0x10, 0x14, 0x18, 0x1C)
-        return tuple(self.mem.read_int(stats_address + offset) for offset in offsets)
+        stats_address = self._resolve("PlayerStats")
+        # All stats are stored in a single block. We read it at once and reorder the stats because
+        # the memory layout does not match the order of the stats in the game
+        buff = self.mem.read_bytes(stats_address, _STATS_STRUCT.size)
+        vig, att, end, st, dex, intel, fth, luck, vit, sl = _STATS_STRUCT.unpack(buff)
+        return (sl, vig, att, end, vit, st, dex, intel, fth, luck)
 
     @player_stats.setter
     def player_stats(self, stats: tuple[int]):
         assert len(stats) == 10, "Stats tuple dimension does not match requirements"
-        stats_address = self.mem.resolve_record(self.data.addresses["PlayerStats"])
-        offsets = (0x2C, 0x00, 0x04, 0x08, 0x28, 0x0C, 0x10, 0x14, 0x18, 0x1C)
-        for stat, offset in zip(stats, offsets):
-            self.mem.write_int(stats_address + offset, stat)
+        stats_address = self._resolve("PlayerStats")
+        sl, vig, att, end, vit, st, dex, intel, fth, luck = stats
+        # Write the stats in two blocks to leave the padding in between untouched
+        buff = _STATS_HEAD_PACK(vig, att, end, st, dex, intel, fth, luck)
+        self.mem.write_bytes(stats_address, buff)
+        self.mem.write_bytes(stats_address + 0x28, _STATS_TAIL_PACK(vit, sl))
 
     @property
     def player_frost_resistance(self) -> float:
@@ -300,15 +357,15 @@ class DarkSoulsIII(Game):
         Returns:
             The player's frostbite resistance.
         """
-        frost_resistance = self.mem.read_record(self.data.addresses["PlayerFrostResistance"])
-        frost_max_resistance = self.mem.read_record(self.data.addresses["PlayerFrostResistanceMax"])
+        frost_resistance = self.mem.read_int(self._resolve("PlayerFrostResistance"))
+        frost_max_resistance = self.mem.read_int(self._resolve("PlayerFrostResistanceMax"))
         return frost_resistance / frost_max_resistance
 
     @player_frost_resistance.setter
     def player_frost_resistance(self, val: float):
         assert 0 <= val <= 1, "Frostbite resistance must be between 0 and 1"
         # First, read the maximum frostbite resistance
-        frost_max_resistance = self.mem.read_record(self.data.addresses["PlayerFrostResistanceMax"])
+        frost_max_resistance = self.mem.read_int(self._resolve("PlayerFrostResistanceMax"))
         # Calculate the absolute frostbite resistance value based on the relative value and the
         # maximum resistance
         frost_resistance = int(val * frost_max_resistance)
@@ -323,7 +380,7 @@ class DarkSoulsIII(Game):
         Returns:
             The player's frostbite effect duration.
         """
-        return self.mem.read_record(self.data.addresses["PlayerFrostEffect"])
+        return self.mem.read_float(self._resolve("PlayerFrostEffect"))
 
     @player_frost_effect.setter
     def player_frost_effect(self, val: float):
@@ -356,27 +413,26 @@ class DarkSoulsIII(Game):
         Returns:
             True if all flags are correct, False otherwise.
         """
-        if self.mem.read_record(self.data.addresses["UntendedGravesFlag"]) == b"\x0a":
+        if self.mem.read_u8(self._resolve("UntendedGravesFlag")) == 0x0A:
             return False
         # Check if the gates to Firelink Shrine are open. If they are, they have to be closed to
         # prevent the player from leaving the arena. This check might seem redundant with the Iudex
         # defeated check. However, it is possible for players to open the gates, revive Iudex with
         # the game interface and then restart the fight with open gates
-        address = self.mem.resolve_record(self.data.addresses["FirelinkShrineGates"])
-        if (self.mem.read_bytes(address, 1)[0] & 8) != 0:  # Gate is open, bit 3 is set
+        if self.mem.read_bit(self._resolve("FirelinkShrineGates"), 3):  # Gate is open, bit 3 is set
             return False
         # The leftmost 3 bits tell if iudex is defeated(7), encountered(6) and his sword is pulled
         # out (5). We need him encountered and his sword pulled out but not defeated. Therefore we
         # check if the value is 0b01100000 = 0x60
-        return self.mem.read_record(self.data.addresses["IudexFlags"]) == b"\x60"  # 01100000
+        return self.mem.read_u8(self._resolve("IudexFlags")) == 0x60  # 01100000
 
     @iudex_flags.setter
     def iudex_flags(self, val: bool):
         if val:
             self.mem.write_record(self.data.addresses["UntendedGravesFlag"], b"\x00")
             self.mem.write_record(self.data.addresses["IudexFlags"], b"\x60")
-            address = self.mem.resolve_record(self.data.addresses["FirelinkShrineGates"])
-            self.mem.write_bit(address, 3, False)  # Close the gates to Firelink Shrine if open
+            # Close the gates to Firelink Shrine if open
+            self.mem.write_bit(self._resolve("FirelinkShrineGates"), 3, False)
 
     @property
     def vordt_flags(self) -> bool:
@@ -384,7 +440,7 @@ class DarkSoulsIII(Game):
 
         See :attr:`.DarkSoulsIII.iudex_flags` for more details.
         """
-        return self.mem.read_record(self.data.addresses["VordtFlags"]) == b"\x40"
+        return self.mem.read_u8(self._resolve("VordtFlags")) == 0x40
 
     @vordt_flags.setter
     def vordt_flags(self, val: bool):
@@ -406,15 +462,16 @@ class DarkSoulsIII(Game):
         Returns:
             A property object that can be used to get and set the boss HP.
         """
+        hp_key = boss_id + "HP"
 
         @property
         def boss_hp(self: DarkSoulsIII) -> int:
-            return self.mem.read_record(self.data.addresses[boss_id + "HP"])
+            return self.mem.read_int(self._resolve(hp_key))
 
         @boss_hp.setter
         def boss_hp(self: DarkSoulsIII, hp: int):
             assert 0 <= hp, "Boss HP has to be zero or positive"
-            self.mem.write_record(self.data.addresses[boss_id + "HP"], hp)
+            self.mem.write_record(self.data.addresses[hp_key], hp)
 
         return boss_hp
 
@@ -432,10 +489,11 @@ class DarkSoulsIII(Game):
         Returns:
             A property object that can be used to get the boss maximum HP.
         """
+        max_hp_key = boss_id + "MaxHP"
 
         @property
         def boss_max_hp(self: DarkSoulsIII) -> int:
-            return self.mem.read_record(self.data.addresses[boss_id + "MaxHP"])
+            return self.mem.read_int(self._resolve(max_hp_key))
 
         @boss_max_hp.setter
         def boss_max_hp(self: DarkSoulsIII, _: int):
@@ -465,24 +523,22 @@ class DarkSoulsIII(Game):
         Returns:
             A property object that can be used to get and set the boss pose.
         """
+        pose_a_key, pose_x_key = boss_id + "PoseA", boss_id + "PoseX"
 
         @property
         def boss_pose(self: DarkSoulsIII) -> np.ndarray:
-            address = self.mem.resolve_record(self.data.addresses[boss_id + "PoseA"])
-            buff = self.mem.read_bytes(address, length=24)
-            a, x, z, y = struct.unpack("f" + 8 * "x" + "fff", buff)  # Order as in the game memory
-            return np.array([x, y, z, a])
+            self.mem.read_into(self._resolve(pose_a_key), self._pose_raw)
+            return self._pose_view[_POSE_INDEX].astype(np.float64)  # Reorder from the memory layout
 
         @boss_pose.setter
         def boss_pose(self: DarkSoulsIII, coordinates: tuple[float]):
             game_speed = self.game_speed
             self.pause()
-            x_addr = self.mem.resolve_record(self.data.addresses[boss_id + "PoseX"])
-            a_addr = self.mem.resolve_record(self.data.addresses[boss_id + "PoseA"])
+            x_addr, a_addr = self._resolve(pose_x_key), self._resolve(pose_a_key)
             # Swap y and z order because the game's coordinates are stored as xzy
-            xzy = struct.pack("fff", coordinates[0], coordinates[2], coordinates[1])
+            _XZY_PACK_INTO(self._xzy_raw, 0, coordinates[0], coordinates[2], coordinates[1])
             # We apply the same strategy as in the player pose property to minimize data races
-            self.mem.write_bytes(x_addr, xzy)
+            self.mem.write_bytes(x_addr, self._xzy_raw)
             self.mem.write_float(a_addr, coordinates[3])
             self.game_speed = game_speed
 
@@ -527,10 +583,11 @@ class DarkSoulsIII(Game):
         Returns:
             A property object that can be used to get and set the boss animation.
         """
+        animation_key, attack_id_key = boss_id + "Animation", boss_id + "AttackID"
 
         @property
         def boss_animation(self: DarkSoulsIII) -> str:
-            animation = self.mem.read_record(self.data.addresses[boss_id + "Animation"])
+            animation = self._read_animation(animation_key)
             # Damage/bleed animations 'SABlend_xxx' overwrite the current animation for ~0.4s. This
             # overwrites the actual current animation. We recover the true animation by reading two
             # registers that contain the current attack integer. This integer is -1 if no attack is
@@ -541,7 +598,7 @@ class DarkSoulsIII(Game):
             # confirm via the attack registers to not catch the tail of an animation that is already
             # finished but still lingers in animation. Alternative bleed animations are "Partxxx".
             if "SABlend" in animation or "Attack" in animation or "Part" in animation:
-                address = self.mem.resolve_record(self.data.addresses[boss_id + "AttackID"])
+                address = self._resolve(attack_id_key)
                 attack_id = self.mem.read_int(address)
                 if attack_id == -1:  # Read fallback register
                     address += 0x10
@@ -571,10 +628,11 @@ class DarkSoulsIII(Game):
         Returns:
             A property object that can be used to get and set the boss animation time.
         """
+        animation_time_key = boss_id + "AnimationTime"
 
         @property
         def boss_animation_time(self: DarkSoulsIII) -> float:
-            return self.mem.read_record(self.data.addresses[boss_id + "AnimationTime"])
+            return self.mem.read_float(self._resolve(animation_time_key))
 
         @boss_animation_time.setter
         def boss_animation_time(self: DarkSoulsIII, _: float):
@@ -596,10 +654,11 @@ class DarkSoulsIII(Game):
         Returns:
             A property object that can be used to get and set the boss animation maximum time.
         """
+        animation_max_time_key = boss_id + "AnimationMaxTime"
 
         @property
         def boss_animation_max_time(self: DarkSoulsIII) -> float:
-            return self.mem.read_record(self.data.addresses[boss_id + "AnimationMaxTime"])
+            return self.mem.read_float(self._resolve(animation_max_time_key))
 
         @boss_animation_max_time.setter
         def boss_animation_max_time(self: DarkSoulsIII, _: float):
@@ -621,15 +680,17 @@ class DarkSoulsIII(Game):
         Returns:
             # A property object that can be used to get and set the `boss attacks` flag.
         """
+        attacks_key = boss_id + "Attacks"
 
         @property
         def boss_attacks(self: DarkSoulsIII) -> bool:
-            return (self.mem.read_record(self.data.addresses[boss_id + "Attacks"])[0] & 64) == 0
+            # Flag prevents attacks if set -> invert
+            return not self.mem.read_bit(self._resolve(attacks_key), 6)
 
         @boss_attacks.setter
         def boss_attacks(self: DarkSoulsIII, flag: bool):
-            address = self.mem.resolve_record(self.data.addresses[boss_id + "Attacks"])
-            self.mem.write_bit(address, 6, not flag)  # Flag prevents attacks if set -> invert
+            # Flag prevents attacks if set -> invert
+            self.mem.write_bit(self._resolve(attacks_key), 6, not flag)
 
         return boss_attacks
 
@@ -649,23 +710,23 @@ class DarkSoulsIII(Game):
             The current camera rotation as normal vector and position as coordinates
             [x, y, z, nx, ny, nz].
         """
-        address = self.mem.resolve_record(self.data.addresses["CamQx"])
-        cam_buff = self.mem.read_bytes(address, length=28)
+        self.mem.read_into(self._resolve("CamQx"), self._cam_raw)
         # Cam orientation seems to be given as a normal vector for the camera plane. As with the
         # position, the game switches y and z
-        nx, nz, ny, x, z, y = struct.unpack("fff" + 4 * "x" + "fff", cam_buff)
+        nx, nz, ny, x, z, y = _CAM_UNPACK(self._cam_raw)
         return np.array([x, y, z, nx, ny, nz])
 
     @camera_pose.setter
     def camera_pose(self, normal: tuple[float]):
         assert len(normal) == 3, "Normal vector must have 3 elements"
         assert self.game_speed > 0, "Camera cannot move while the game is paused"
-        normal = np.array(normal, dtype=np.float64)
-        normal /= np.linalg.norm(normal)
-        normal_angle = np.arctan2(*normal[:2])
-        cpose = self.camera_pose
-        dz = cpose[5] - normal[2]  # Camera pose is [x, y, z, nx, ny, nz], we need nz
-        d_angle = wrap_to_pi(np.arctan2(cpose[3], cpose[4]) - normal_angle)
+        # Scalar math avoids the numpy overhead for single values. The angle is invariant to the
+        # normal's scale, so only the z component has to be normalized
+        x, y, z = (float(v) for v in normal)
+        normal_angle, normal_z = math.atan2(x, y), z / math.sqrt(x * x + y * y + z * z)
+        nx, ny, nz = self._camera_normal()
+        dz = nz - normal_z
+        d_angle = wrap_to_pi(math.atan2(nx, ny) - normal_angle)
         t = 0
         # If lock on is already established and target is out of tolerances, the cam can't move. We
         # limit camera rotations to 50 actions to not run into an infinite loop where the camera
@@ -677,14 +738,24 @@ class DarkSoulsIII(Game):
                 self._game_input.add_action("cameraleft" if d_angle > 0 else "cameraright")
             self._game_input.update_input()
             time.sleep(0.02)
-            cpose = self.camera_pose
-            dz = cpose[5] - normal[2]
-            d_angle = wrap_to_pi(np.arctan2(cpose[3], cpose[4]) - normal_angle)
+            nx, ny, nz = self._camera_normal()
+            dz = nz - normal_z
+            d_angle = wrap_to_pi(math.atan2(nx, ny) - normal_angle)
             t += 1
             # Sometimes the initial cam key presses get "lost" and the cam does not move while the
             # buttons remain pressed. Resetting the game input on each iteration avoids this issue
             self._game_input.reset()
 
+    def _camera_normal(self) -> tuple[float, float, float]:
+        """Read the normal of the camera plane without creating a camera pose array.
+
+        Returns:
+            The camera plane normal as (nx, ny, nz).
+        """
+        self.mem.read_into(self._resolve("CamQx"), self._cam_raw)
+        nx, nz, ny, _, _, _ = _CAM_UNPACK(self._cam_raw)
+        return nx, ny, nz
+
     @property
     def last_bonfire(self) -> str:
         """The bonfire name the player has rested at last.
@@ -694,29 +765,27 @@ class DarkSoulsIII(Game):
         Returns:
             The bonfire name.
         """
-        # Get the integer ID and look up the corresponding key to this value from the bonfires dict
-        int_id = self.mem.read_record(self.data.addresses["LastBonfire"])
-        str_id = list(self.data.bonfires.keys())[list(self.data.bonfires.values()).index(int_id)]
-        return str_id
+        # Get the integer ID and look up the corresponding bonfire name
+        int_id = self.mem.read_int(self._resolve("LastBonfire"))
+        return self.data.bonfire_names[int_id]
 
     @last_bonfire.setter
     def last_bonfire(self, name: str):
-        assert name in self.data.bonfires.keys(), f"Unknown bonfire {name} specified!"
+        bonfire_id = self.data.bonfires.get(name)
+        assert bonfire_id is not None, f"Unknown bonfire {name} specified!"
         # See Iudex flags for details on the Untended Graves flag
         ug_flag = b"\x0a" if name in ("Untended Graves", "Champion Gundyr") else b"\x00"
         self.mem.write_record(self.data.addresses["UntendedGravesFlag"], ug_flag)
-        self.mem.write_record(self.data.addresses["LastBonfire"], self.data.bonfires[name])
+        self.mem.write_record(self.data.addresses["LastBonfire"], bonfire_id)
 
     @property
     def allow_attacks(self) -> bool:
         """Globally enable/disable attacks for all entities."""
-        address = self.mem.bases["WorldChrManDbg_Flags"] + 0xB
-        return self.mem.read_bytes(address, length=1) == b"\x00"
+        return self._read_dbg_flag(0xB)
 
     @allow_attacks.setter
     def allow_attacks(self, flag: bool):
-        address = self.mem.bases["WorldChrManDbg_Flags"] + 0xB
-        self.mem.write_bytes(address, struct.pack("B", not flag))
+        self._write_dbg_flag(0xB, flag)
 
     @property
     def allow_hits(self) -> bool:
@@ -725,67 +794,154 @@ class DarkSoulsIII(Game):
         No hits is equivalent to all entities having unlimited iframes, i.e. they are unaffected by
         all attacks, staggers etc.
         """
-        address = self.mem.bases["WorldChrManDbg_Flags"] + 0xA
-        return self.mem.read_bytes(address, length=1) == b"\x00"
+        return self._read_dbg_flag(0xA)
 
     @allow_hits.setter
     def allow_hits(self, flag: bool):
-        address = self.mem.bases["WorldChrManDbg_Flags"] + 0xA
-        self.mem.write_bytes(address, struct.pack("B", not flag))
+        self._write_dbg_flag(0xA, flag)
 
     @property
     def allow_moves(self) -> bool:
         """Globally enable/disable movement for all entities."""
-        address = self.mem.bases["WorldChrManDbg_Flags"] + 0xC
-        return self.mem.read_bytes(address, length=1) == b"\x00"
+        return self._read_dbg_flag(0xC)
 
     @allow_moves.setter
     def allow_moves(self, flag: bool):
-        address = self.mem.bases["WorldChrManDbg_Flags"] + 0xC
-        self.mem.write_bytes(address, struct.pack("B", not flag))
+        self._write_dbg_flag(0xC, flag)
 
     @property
     def allow_deaths(self) -> bool:
         """Globally enable/disable deaths for all entities."""
-        address = self.mem.bases["WorldChrManDbg_Flags"] + 0x8
-        return self.mem.read_bytes(address, length=1) == b"\x00"
+        return self._read_dbg_flag(0x8)
 
     @allow_deaths.setter
     def allow_deaths(self, flag: bool):
-        address = self.mem.bases["WorldChrManDbg_Flags"] + 0x8
-        self.mem.write_bytes(address, struct.pack("B", not flag))
+        self._write_dbg_flag(0x8, flag)
 
     @property
     def allow_weapon_durability_dmg(self) -> bool:
         """Globally enable/disable weapon durability damage for all entities."""
-        address = self.mem.bases["WorldChrManDbg_Flags"] + 0xE
-        return self.mem.read_bytes(address, length=1) == b"\x00"
+        return self._read_dbg_flag(0xE)
 
     @allow_weapon_durability_dmg.setter
     def allow_weapon_durability_dmg(self, flag: bool):
-        address = self.mem.bases["WorldChrManDbg_Flags"] + 0xE
-        self.mem.write_bytes(address, struct.pack("B", not flag))
+        self._write_dbg_flag(0xE, flag)
+
+    def set_dbg_flags(
+        self,
+        *,
+        player_death: bool | None = None,
+        deaths: bool | None = None,
+        hits: bool | None = None,
+        attacks: bool | None = None,
+        moves: bool | None = None,
+        durability: bool | None = None,
+    ):
+        """Set multiple debug flags at once.
+
+        All flags are set with one memory read and one memory write of the debug flag region. Flags
+        that are not specified keep their current value.
+
+        Args:
+            player_death: Set ``allow_player_death``.
+            deaths: Set ``allow_deaths``.
+            hits: Set ``allow_hits``.
+            attacks: Set ``allow_attacks``.
+            moves: Set ``allow_moves``.
+            durability: Set ``allow_weapon_durability_dmg``.
+        """
+        flags = (player_death, deaths, hits, attacks, moves, durability)
+        region = self._read_dbg_flags()
+        buff = bytearray(region)
+        for offset, flag in zip(self._DBG_FLAG_OFFSETS, flags):
+            if flag is not None:
+                buff[offset] = 0 if flag else 1  # A set byte disables the feature
+        if buff != region:
+            self.mem.write_bytes(self.mem.bases["WorldChrManDbg_Flags"], buff)
+
+    def _read_dbg_flags(self) -> bytes:
+        """Read the raw debug flag region with a single memory read.
+
+        Returns:
+            The raw bytes of all debug flags.
+        """
+        return self.mem.read_bytes(self.mem.bases["WorldChrManDbg_Flags"], self._DBG_FLAGS_SIZE)
+
+    def _read_dbg_flag(self, offset: int) -> bool:
+        """Read a debug flag from the game memory.
+
+        Args:
+            offset: The flag offset from the WorldChrManDbg_Flags base.
+
+        Returns:
+            True if the flag's feature is enabled, else False.
+        """
+        return self.mem.read_u8(self.mem.bases["WorldChrManDbg_Flags"] + offset) == 0
+
+    def _write_dbg_flag(self, offset: int, flag: bool):
+        """Write a debug flag to the game memory.
+
+        Args:
+            offset: The flag offset from the WorldChrManDbg_Flags base.
+            flag: True enables the flag's feature, False disables it.
+        """
+        address = self.mem.bases["WorldChrManDbg_Flags"] + offset
+        self.mem.write_bytes(address, _FLAG_BYTES[bool(flag)])
 
     def reload(self):
         """Kill the player, clear the address cache and wait for the player to respawn."""
         self.player_hp = 0
         self._save_game_flags()
-        if self.game_speed == 0:
+        if self._game_speed == 0:
             self.resume()  # For safety, player might never change animation otherwise
         self.clear_cache()
         self.sleep(0.5)  # Give the game time to register player death and change animation
+        self._wait_for_respawn()
+        self._restore_game_flags()
+
+    def _wait_for_respawn(self, interval: float = 0.05):
+        """Wait until the player has respawned and reached a safe "Idle" state.
+
+        Both the resurrection and the "Idle" animation are awaited in a single polling loop. Instead
+        of decoding the animation string on each poll, we compare the raw memory against the
+        encoded animations. The player is reallocated during the reload, so the address is resolved
+        from scratch on each poll until the resurrection. Afterwards, the resolved address is
+        reused. While the player is dead and the animation does not change, the polls back off to
+        at most four times the interval.
+
+        Args:
+            interval: The ingame time between polls in seconds.
+
+        Raises:
+            MemoryReadError: The animation could not be read after the resurrection.
+        """
+        record = self.data.addresses["PlayerAnimation"]
+        address, resurrected = None, False
+        animation, last_animation, delay = None, None, interval
         while True:
             try:
-                # Break on player resurrection animation. If missed, also break on Idle
-                if self.player_animation in ("Event63000", "Idle"):
-                    break
-            except (MemoryReadError, UnicodeDecodeError):  # Read during death reset might fail
-                pass
-            self.clear_cache()
-            self.sleep(0.05)
-        while self.player_animation != "Idle":  # Wait for the player to reach a safe "Idle" state
-            self.sleep(0.05)
-        self._restore_game_flags()
+                # A stale animation address might still be readable and would never match
+                if not resurrected:
+                    self.clear_cache()
+                    address = self.mem.resolve_record(record)
+                animation = self.mem.read_bytes(address, record["length"])
+                # Wait for the player resurrection animation. If missed, also accept Idle
+                if not resurrected:
+                    resurrected = animation.startswith((_ANIM_EVENT63000, _ANIM_IDLE))
+                # Wait for the player to reach a safe "Idle" state
+                if resurrected and animation.startswith(_ANIM_IDLE):
+                    return
+            except MemoryReadError:  # Read during death reset might fail
+                if resurrected:  # The player is loaded, reads from the resolved address must work
+                    raise
+                animation = None
+            # Once resurrected, we poll at the full rate to detect the "Idle" state without delay
+            if resurrected or animation != last_animation:
+                delay = interval
+            else:
+                delay = min(delay * 1.3, 4 * interval)
+            last_animation = animation
+            self.sleep(delay)
 
     @property
     def lock_on(self) -> bool:
@@ -797,7 +953,7 @@ class DarkSoulsIII(Game):
         Returns:
             True if the player is currently locked on a target, else False.
         """
-        return struct.unpack("?", self.mem.read_record(self.data.addresses["LockOn"]))[0]
+        return self.mem.read_u8(self._resolve("LockOn")) != 0
 
     @property
     def lock_on_bonus_range(self) -> float:
@@ -809,7 +965,7 @@ class DarkSoulsIII(Game):
         Returns:
             The current maximum bonus lock on range.
         """
-        return self.mem.read_record(self.data.addresses["LockOnBonusRange"])
+        return self.mem.read_float(self._resolve("LockOnBonusRange"))
 
     @lock_on_bonus_range.setter
     def lock_on_bonus_range(self, val: float):
@@ -826,7 +982,7 @@ class DarkSoulsIII(Game):
         Returns:
             The current line of sight lock on deactivate time.
         """
-        return self.mem.read_record(self.data.addresses["LoSLockOnTime"])
+        return self.mem.read_float(self._resolve("LoSLockOnTime"))
 
     @los_lock_on_deactivate_time.setter
     def los_lock_on_deactivate_time(self, val: float):
@@ -847,19 +1003,18 @@ class DarkSoulsIII(Game):
         Returns:
             The current game time.
         """
-        return self.mem.read_record(self.data.addresses["Time"])
+        return self.mem.read_int(self._resolve("Time"))
 
     @time.setter
     def time(self, val: int):
-        assert isinstance(val, int)
         self.mem.write_record(self.data.addresses["Time"], val)
 
     @staticmethod
     def timed(tend: int, tstart: int) -> float:
         """Safe game time difference function.
 
-        If time has overflowed, uses 0 as best guess for tstart. Divides by 1000 to get the time
-        difference in seconds.
+        If time has overflowed, uses 0 as best guess for tstart. Converts the time difference
+        from milliseconds to seconds.
 
         Args:
             tend: End time.
@@ -868,7 +1023,7 @@ class DarkSoulsIII(Game):
         Returns:
             The time difference.
         """
-        return (tend - tstart) / 1000 if tend >= tstart else tend / 1000
+        return (tend - tstart) * _MS_TO_S if tend >= tstart else tend * _MS_TO_S
 
     def sleep(self, t: float):
         """Custom sleep function.
@@ -879,15 +1034,21 @@ class DarkSoulsIII(Game):
             t: Time interval in seconds.
         """
         assert t > 0
-        assert self.game_speed > 0, "Game can't be paused during sleeps"
-        # We save the start time and use nonbusy python sleeps while t has not been reached
-        tstart, td = self.time, t
+        speed = self._game_speed
+        assert speed > 0, "Game can't be paused during sleeps"
+        # We save the start time and use nonbusy python sleeps while t has not been reached. The
+        # wall time of the sleeps is scaled by the game speed so that we don't wake up early (or
+        # late) and waste game time reads. Lags can still slow down the game, so we verify with
+        # the game time after each sleep
+        tstart, td = self.time, t / speed
         while True:
             time.sleep(td)
             tcurr = self.time
-            if self.timed(tcurr, tstart) > t:
+            # Inlined version of timed() to avoid the method calls in the loop
+            dt = (tcurr - tstart) * _MS_TO_S if tcurr >= tstart else tcurr * _MS_TO_S
+            if dt > t:
                 break
-            td = max(t - self.timed(tcurr, tstart), 1e-3)  # 1e-3 is the min waiting interval
+            td = max((t - dt) / speed, 1e-3)  # 1e-3 is the min waiting interval
 
     @property
     def game_speed(self) -> float:
@@ -927,12 +1088,11 @@ class DarkSoulsIII(Game):
             True if gravity is active, else False.
         """
         # Gravity disabled flag is saved at bit 6 (including 0)
-        return self.mem.read_record(self.data.addresses["noGravity"]) & 64 == 0
+        return not self.mem.read_bit(self._resolve("noGravity"), 6)
 
     @gravity.setter
     def gravity(self, flag: bool):
-        address = self.mem.resolve_record(self.data.addresses["noGravity"])
-        self.mem.write_bit(address, index=6, value=0 if flag else 1)
+        self.mem.write_bit(self._resolve("noGravity"), index=6, value=0 if flag else 1)
 
     @property
     def is_ingame(self) -> bool:
@@ -963,24 +1123,53 @@ class DarkSoulsIII(Game):
         """
         self.mem.clear_cache()
 
+    def _resolve(self, key: str) -> int:
+        """Resolve the address of a game record.
+
+        Args:
+            key: The name of the address record.
+
+        Returns:
+            The resolved address.
+        """
+        return self.mem.resolve_record(self.data.addresses[key])
+
+    def _read_animation(self, key: str) -> str:
+        """Read an animation name and skip the decoding if it has not changed since the last read.
+
+        Animations usually last for many frames, so most reads return the same raw bytes. The
+        decoded name is cached together with the raw bytes and reused as long as they match.
+
+        Args:
+            key: The name of the animation address record.
+
+        Returns:
+            The animation name.
+        """
+        record = self.data.addresses[key]
+        raw = self.mem.read_bytes(self._resolve(key), record["length"])
+        cached = self._animation_cache.get(key)
+        if cached is not None and cached[0] == raw:
+            return cached[1]
+        animation = self.mem.decode_string(raw, codec=record["codec"])
+        self._animation_cache[key] = (raw, animation)
+        return animation
+
     def _save_game_flags(self):
-        """Save game flags to the game flags cache."""
-        self._game_flags["allow_attacks"] = self.allow_attacks
-        self._game_flags["allow_deaths"] = self.allow_deaths
-        self._game_flags["allow_hits"] = self.allow_hits
-        self._game_flags["allow_moves"] = self.allow_moves
-        self._game_flags["allow_player_death"] = self.allow_player_death
-        self._game_flags["allow_weapon_durability_dmg"] = self.allow_weapon_durability_dmg
+        """Save game flags to the game flags cache.
+
+        All flags are located in the same memory region, so we save the raw region in a single read.
+        """
+        self._game_flags = self._read_dbg_flags()
 
     def _restore_game_flags(self):
         """Set the game flags to the values saved in the game flags cache.
 
+        The saved memory region is written back in a single write without reading the current flags.
+        This also restores the other WorldChrManDbg flags within the region to their saved values.
+
         Note:
             :meth:`.Game._save_game_flags` has to be called at least once before this method.
         """
-        self.allow_attacks = self._game_flags["allow_attacks"]
-        self.allow_deaths = self._game_flags["allow_deaths"]
-        self.allow_hits = self._game_flags["allow_hits"]
-        self.allow_moves = self._game_flags["allow_moves"]
-        self.allow_player_death = self._game_flags["allow_player_death"]
-        self.allow_weapon_durability_dmg = self._game_flags["allow_weapon_durability_dmg"]
+        assert self._game_flags is not None, "Game flags have to be saved before restoring them"
+        self.mem.write_bytes(self.mem.bases["WorldChrManDbg_Flags"], self._game_flags)
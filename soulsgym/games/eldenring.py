@@ -1,6 +1,8 @@
 """This module contains the game interface for Elden Ring."""
 
+import ctypes
 import logging
+import math
 import struct
 import time
 from typing import Any
@@ -13,6 +15,21 @@ from soulsgym.games import Game
 
 logger = logging.getLogger(__name__)
 
+# Precompiled memory layouts. Coordinates are stored in x, z, y order
+_XZY_STRUCT = struct.Struct("fff")
+# Camera memory layout: Normal nx, nz, ny, 4 bytes padding, x, z, y
+_CAM_UNPACK = struct.Struct("fff4xfff").unpack
+# Player stats memory layout: Vigor, Mind, Endurance, Strength, Dexterity, Intelligence, Faith,
+# Arcane, 12 bytes padding, Soul Level
+_STATS_STRUCT = struct.Struct("8i12xi")
+_STATS_HEAD_PACK = struct.Struct("8i").pack
+# Player resource memory layout: HP, 12 bytes (maximum HP and others), MP, 8 bytes (maximum MP
+# and others), SP
+_HP_SP_MP_STRUCT = struct.Struct("i12xi8xi")
+# Player pose memory layout as floats: x, z, y, a. The index gathers the pose in [x, y, z, a] order
+_POSE_INDEX = np.array([0, 2, 1, 3])
+_MS_TO_S = 1 / 1000  # Conversion factor from the game time in milliseconds to seconds
+
 
 class EldenRing(Game):
     """Elden Ring game interface."""
@@ -24,6 +41,9 @@ class EldenRing(Game):
         """Create a new EldenRing game interface and set the game speed to 1.0."""
         super().__init__()
         self._game_flags = {}  # Cache game flags to restore them after a game reload
+        self._pose_raw = (ctypes.c_char * 16)()  # Reused buffer for player pose reads
+        self._pose_view = np.frombuffer(self._pose_raw, dtype=np.float32)  # Float view on buffer
+        self._xzy_raw = bytearray(12)  # Reused buffer for player coordinate writes
         self._game_speed = 1.0
         self.game_speed = 1.0
 
@@ -100,6 +120,24 @@ class EldenRing(Game):
     def player_mp(self, mp: int):
         self.mem.write_record(self.data.addresses["PlayerMP"], mp)
 
+    @property
+    def player_hp_sp_mp(self) -> tuple[int, int, int]:
+        """The player's current hit points, stamina points and mana points.
+
+        All values are stored in the same block and read with a single memory access. Use this
+        property instead of the individual properties if more than one value is required.
+
+        Returns:
+            The player's current hit points, stamina points and mana points.
+        """
+        address = self.mem.resolve_record(self.data.addresses["PlayerHP"])
+        hp, mp, sp = _HP_SP_MP_STRUCT.unpack(self.mem.read_bytes(address, _HP_SP_MP_STRUCT.size))
+        return hp, sp, mp
+
+    @player_hp_sp_mp.setter
+    def player_hp_sp_mp(self, _: tuple[int, int, int]):
+        raise NotImplementedError("Use player_hp, player_sp and player_mp to set the values")
+
     @property
     def player_max_hp(self) -> int:
         """The player's maximum hit points.
@@ -169,8 +207,9 @@ class EldenRing(Game):
         Returns:
             The current player pose as [x, y, z, a].
         """
-        x, z, y, a = struct.unpack("ffff", self.mem.read_record(self.data.addresses["PlayerXYZA"]))
-        return np.array([x, y, z, a])
+        address = self.mem.resolve_record(self.data.addresses["PlayerXYZA"])
+        self.mem.read_into(address, self._pose_raw)
+        return self._pose_view[_POSE_INDEX].astype(np.float64)  # Reorder from the memory layout
 
     @player_pose.setter
     def player_pose(self, coordinates: list[float]):
@@ -180,21 +219,28 @@ class EldenRing(Game):
         # 3) Read local coordinates
         # 4) Write local coordinates + difference to memory
         assert -np.pi <= coordinates[3] <= np.pi, "Player angle must be in [-pi, pi]"
-        allow_player_death = self.allow_player_death
-        self.allow_player_death = False
+        # Bit 0 of the flag byte disables player deaths. Only the bit is modified, the game might
+        # change the other bits of the byte during the teleport
+        death_address = self.mem.resolve_record(self.data.addresses["AllowPlayerDeath"])
+        allow_player_death = not self.mem.read_bit(death_address, 0)
+        if allow_player_death:
+            self.mem.write_bit(death_address, index=0, value=1)
         # Read global coordinates, calculate the difference to the target coordinates
-        delta = np.array(coordinates[:3]) - self.player_pose[:3]
+        gx, gy, gz, _ = self.player_pose
+        dx, dy, dz = coordinates[0] - gx, coordinates[1] - gy, coordinates[2] - gz
         # Read local coords, add the difference and write the new local coords
-        x, z, y = struct.unpack("fff", self.mem.read_record(self.data.addresses["PlayerLocalXYZ"]))
-        new_global_pos = struct.pack("fff", x + delta[0], z + delta[2], y + delta[1])
-        self.mem.write_record(self.data.addresses["PlayerLocalXYZ"], new_global_pos)
+        address = self.mem.resolve_record(self.data.addresses["PlayerLocalXYZ"])
+        x, z, y = _XZY_STRUCT.unpack(self.mem.read_bytes(address, _XZY_STRUCT.size))
+        _XZY_STRUCT.pack_into(self._xzy_raw, 0, x + dx, z + dz, y + dy)
+        self.mem.write_bytes(address, self._xzy_raw)
         # TODO: Rotation is currently not working
         # address = self.mem.resolve_record(self.data.addresses["PlayerLocalQ"])
         # See https://www.euclideanspace.com/maths/geometry/rotations/conversions/index.htm
         # qw, qx, qz, qy = np.cos(coordinates[3] / 2), 0, np.sin(coordinates[3] / 2), 0
         # Order in the memory structure is qw qx qz qy
         # self.mem.write_bytes(address, struct.pack('ffff', qw, qx, qz, qy))
-        self.allow_player_death = allow_player_death
+        if allow_player_death:
+            self.mem.write_bit(death_address, index=0, value=0)
 
     @property
     def player_animation(self) -> int:
@@ -215,7 +261,8 @@ class EldenRing(Game):
     @property
     def allow_player_death(self) -> bool:
         """Disable/enable player deaths ingame."""
-        return not self.mem.read_record(self.data.addresses["AllowPlayerDeath"]) & 1
+        address = self.mem.resolve_record(self.data.addresses["AllowPlayerDeath"])
+        return not self.mem.read_bit(address, 0)
 
     @allow_player_death.setter
     def allow_player_death(self, flag: bool):
@@ -234,16 +281,19 @@ class EldenRing(Game):
             A tuple with all player attributes in the same order as in the game.
         """
         address = self.mem.resolve_record(self.data.addresses["PlayerStats"])
-        offsets = (0x2C, 0x00, 0x04, 0x08, 0x0C, 0x10, 0x14, 0x18, 0x1C)
-        return tuple(self.mem.read_int(address + offset) for offset in offsets)
+        # All stats are stored in a single block. We read it at once and move the soul level to the
+        # front to match the order of the stats in the game
+        *attributes, sl = _STATS_STRUCT.unpack(self.mem.read_bytes(address, _STATS_STRUCT.size))
+        return (sl, *attributes)
 
     @player_stats.setter
     def player_stats(self, stats: list[int]):
         assert len(stats) == 9, "Stats tuple dimension does not match requirements"
         address = self.mem.resolve_record(self.data.addresses["PlayerStats"])
-        offsets = (0x2C, 0x00, 0x04, 0x08, 0x0C, 0x10, 0x14, 0x18, 0x1C)
-        for stat, offset in zip(stats, offsets):
-            self.mem.write_int(address + offset, stat)
+        # Write the attributes as one block and the soul level separately to leave the padding in
+        # between untouched
+        self.mem.write_bytes(address, _STATS_HEAD_PACK(*stats[1:]))
+        self.mem.write_int(address + 0x2C, stats[0])
 
     @property
     def camera_pose(self) -> np.ndarray:
@@ -259,21 +309,22 @@ class EldenRing(Game):
         buff = self.mem.read_record(self.data.addresses["LocalCam"])
         # cam orientation seems to be given as a normal vector for the camera plane. As with the
         # position, the game switches y and z
-        nx, nz, ny, x, z, y = struct.unpack("fff" + 4 * "x" + "fff", buff)
+        nx, nz, ny, x, z, y = _CAM_UNPACK(buff)
         # In Elden Ring, the xyz coordinates use chunks -> We have to add the current chunk values
-        cx, cz, cy = struct.unpack("fff", self.mem.read_record(self.data.addresses["ChunkCamXYZ"]))
+        cx, cz, cy = _XZY_STRUCT.unpack(self.mem.read_record(self.data.addresses["ChunkCamXYZ"]))
         return np.array([x - cx, y - cy, z - cz, nx, ny, nz])
 
     @camera_pose.setter
     def camera_pose(self, normal: list[float]):
         assert len(normal) == 3, "Normal vector must have 3 elements"
         assert self.game_speed > 0, "Camera cannot move while the game is paused"
-        normal = np.array(normal, dtype=np.float64)
-        normal /= np.linalg.norm(normal)
-        normal_angle = np.arctan2(*normal[:2])
-        cpose = self.camera_pose
-        dz = cpose[5] - normal[2]  # Camera pose is [x, y, z, nx, ny, nz], we need nz
-        d_angle = wrap_to_pi(np.arctan2(cpose[3], cpose[4]) - normal_angle)
+        # Scalar math avoids the numpy overhead for single values. The angle is invariant to the
+        # normal's scale, so only the z component has to be normalized
+        x, y, z = (float(v) for v in normal)
+        normal_angle, normal_z = math.atan2(x, y), z / math.sqrt(x * x + y * y + z * z)
+        nx, ny, nz = self._camera_normal()
+        dz = nz - normal_z
+        d_angle = wrap_to_pi(math.atan2(nx, ny) - normal_angle)
         t = 0
         # If lock on is already established and target is out of tolerances, the cam can't move. We
         # limit camera rotations to 50 actions to not run into an infinite loop where the camera
@@ -285,14 +336,25 @@ class EldenRing(Game):
                 self._game_input.add_action("cameraleft" if d_angle > 0 else "cameraright")
             self._game_input.update_input()
             time.sleep(0.01)
-            cpose = self.camera_pose
-            dz = cpose[5] - normal[2]
-            d_angle = wrap_to_pi(np.arctan2(cpose[3], cpose[4]) - normal_angle)
+            nx, ny, nz = self._camera_normal()
+            dz = nz - normal_z
+            d_angle = wrap_to_pi(math.atan2(nx, ny) - normal_angle)
             t += 1
             # Sometimes the initial cam key presses get "lost" and the cam does not move while the
             # buttons remain pressed. Resetting the game input on each iteration avoids this issue
             self._game_input.reset()
 
+    def _camera_normal(self) -> tuple[float, float, float]:
+        """Read the normal of the camera plane without creating a camera pose array.
+
+        The normal does not depend on the camera chunk, so the chunk coordinates are not read.
+
+        Returns:
+            The camera plane normal as (nx, ny, nz).
+        """
+        nx, nz, ny, _, _, _ = _CAM_UNPACK(self.mem.read_record(self.data.addresses["LocalCam"]))
+        return nx, ny, nz
+
     @property
     def is_ingame(self) -> bool:
         """Flag that checks if the player is currently loaded into the game.
@@ -314,15 +376,15 @@ class EldenRing(Game):
         Returns:
             The bonfire name.
         """
-        # Get the integer ID and look up the corresponding key to this value from the bonfires dict
+        # Get the integer ID and look up the corresponding bonfire name
         int_id = self.mem.read_record(self.data.addresses["LastGrace"])
-        str_id = list(self.data.bonfires.keys())[list(self.data.bonfires.values()).index(int_id)]
-        return str_id
+        return self.data.bonfire_names[int_id]
 
     @last_bonfire.setter
     def last_bonfire(self, name: str):
-        assert name in self.data.bonfires.keys(), f"Unknown bonfire {name} specified!"
-        self.mem.write_record(self.data.addresses["LastGrace"], self.data.bonfires[name])
+        bonfire_id = self.data.bonfires.get(name)
+        assert bonfire_id is not None, f"Unknown bonfire {name} specified!"
+        self.mem.write_record(self.data.addresses["LastGrace"], bonfire_id)
 
     @property
     def lock_on(self) -> bool:
@@ -334,7 +396,8 @@ class EldenRing(Game):
         Returns:
             True if the player is currently locked on a target, else False.
         """
-        return bool(self.mem.read_record(self.data.addresses["LockOn"])[0])
+        address = self.mem.resolve_record(self.data.addresses["LockOn"])
+        return self.mem.read_u8(address) != 0
 
     @property
     def gravity(self) -> bool:
@@ -343,8 +406,8 @@ class EldenRing(Game):
         Returns:
             True if gravity is active, else False.
         """
-        buff = self.mem.read_record(self.data.addresses["PlayerGravity"])
-        return buff & 1 == 0  # Gravity disabled flag is saved at bit 6 (including 0)
+        address = self.mem.resolve_record(self.data.addresses["PlayerGravity"])
+        return not self.mem.read_bit(address, 0)  # Gravity disabled flag is saved at bit 0
 
     @gravity.setter
     def gravity(self, flag: bool):
@@ -432,16 +495,21 @@ class EldenRing(Game):
             t: Time interval in seconds.
         """
         assert t > 0
-        assert self.game_speed > 0, "Game can't be paused during sleeps"
-        # We save the start time and use nonbusy python sleeps while t has not been reached
-        tstart, td = self.time, t
+        speed = self._game_speed
+        assert speed > 0, "Game can't be paused during sleeps"
+        # We save the start time and use nonbusy python sleeps while t has not been reached. The
+        # wall time of the sleeps is scaled by the game speed so that we don't wake up early (or
+        # late) and waste game time reads. Lags can still slow down the game, so we verify with
+        # the game time after each sleep
+        tstart, td = self.time, t / speed
         while True:
-            time.sleep(td / self.game_speed)
+            time.sleep(td)
             tcurr = self.time
-            if self.timed(tcurr, tstart) > t:
+            # Inlined version of timed() to avoid the method calls in the loop
+            dt = (tcurr - tstart) * _MS_TO_S if tcurr >= tstart else tcurr * _MS_TO_S
+            if dt > t:
                 break
-            # 1e-3 / game_speed is the min waiting interval
-            td = max(t - self.timed(tcurr, tstart), 1e-3) / self.game_speed
+            td = max((t - dt) / speed, 1e-3)  # 1e-3 is the min waiting interval
 
     @property
     def game_speed(self) -> float:
@@ -52,6 +52,7 @@ class StaticGameData:
     boss_animations: dict
     player_stats: dict
     bonfires: dict
+    bonfire_names: dict
     address_bases: dict
     addresses: dict
     address_base_patterns: dict
@@ -71,6 +72,8 @@ class StaticGameData:
         self.boss_animations = boss_animations[game_id]
         self.player_stats = player_stats[game_id]
         self.bonfires = bonfires[game_id]
+        # Reverse lookup from the in-game bonfire IDs to their names
+        self.bonfire_names = {v: k for k, v in self.bonfires.items()}
         self.address_bases = address_bases[game_id]
         self.addresses = addresses[game_id]
         self.address_base_patterns = address_base_patterns[game_id]
@@ -37,6 +37,10 @@ game_attributes = {
         "type": int,
         ">=": 0
     },
+    "player_hp_sp": {
+        "type": tuple,
+        "len": 2
+    },
     "player_max_hp": {
         "type": int,
         ">": 0
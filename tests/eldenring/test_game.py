@@ -34,6 +34,7 @@ game_attributes = {"player_hp": {"type": int, ">": 0},
                    "player_max_sp": {"type": int, ">": 0},
                    "player_mp": {"type": int, ">=": 0},
                    "player_max_mp": {"type": int, ">": 0},
+                   "player_hp_sp_mp": {"type": tuple, "len": 3},
                    "player_pose": {"type": np.ndarray, "shape": (4, )},
                    "player_animation": {"type": int},
                    "allow_player_death": {"type": bool},